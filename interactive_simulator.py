@@ -4,14 +4,25 @@ import customtkinter
 import pandas as pd
 import pvlib
 import os
+import csv
 import matplotlib
 matplotlib.use('Agg') # Use non-interactive backend for stability
 import matplotlib.pyplot as plt
+plt.rcParams['savefig.dpi'] = 80 # Plots are rendered at their on-screen size (400x320)
+from matplotlib.figure import Figure
 from matplotlib.ticker import FuncFormatter
 from PIL import Image, ImageTk
 import threading
+import io
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, wait
+import multiprocessing
 import numpy as np
+from numba import njit
 import time
+import math
+import functools
+from collections import OrderedDict
 
 # --- PART 1: DATA AND SIMULATION LOGIC (BACKEND) ---
 
@@ -24,38 +35,97 @@ GERMAN_CITIES = {
     "Potsdam": (52.3906, 13.0645), "Stuttgart": (48.7758, 9.1829)
 }
 
+@functools.lru_cache(maxsize=2)
+def _get_sam(kind):
+    """
+    Loads a SAM component database ('CECMod' or 'CECInverter') once per process.
+    """
+    return pvlib.pvsystem.retrieve_sam(kind)
+
+# NaN-skipping like pandas' .sum(), so only the reordering flags of fastmath are enabled
+@njit(cache=True, fastmath={'reassoc', 'nsz', 'contract'})
+def _reduce3(ac, dc, eff):
+    """
+    Sums the AC power, DC power and effective irradiance series in a single pass.
+    """
+    s1 = s2 = s3 = 0.0
+    for i in range(ac.size):
+        if not np.isnan(ac[i]):
+            s1 += ac[i]
+        if not np.isnan(dc[i]):
+            s2 += dc[i]
+        if not np.isnan(eff[i]):
+            s3 += eff[i]
+    return s1, s2, s3
+
+def _add_daily_profile_slice(tmy_data):
+    """
+    Stores the positional slice of the sunny-day profile (July 15) in the DataFrame's attrs.
+    The TMY calendar never changes for a location, so this is computed once per load.
+    """
+    idx = tmy_data.index
+    hours = np.flatnonzero((idx.month == 7) & (idx.day == 15))
+    if hours.size:
+        tmy_data.attrs['jul15'] = slice(hours[0], hours[-1] + 1)
+    return tmy_data
+
+def _write_parquet_atomic(tmy_data, file_path):
+    """
+    Writes the TMY cache to a temporary file and moves it into place, so concurrent loaders
+    (prefetch, simulation thread, batch workers) never see a partly written file.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(file_path), suffix='.parquet.tmp')
+    os.close(fd)
+    try:
+        tmy_data.to_parquet(tmp_path, engine='pyarrow', compression='zstd')
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
 def get_tmy_data(latitude, longitude, city_name=None, data_folder='data'):
     """
     Downloads TMY (Typical Meteorological Year) data for a given location.
-    Caches the data locally to avoid re-downloading.
+    Caches the data locally as Parquet to avoid re-downloading; older CSV caches are converted on first use.
     """
     os.makedirs(data_folder, exist_ok=True)
     if city_name:
-        file_path = os.path.join(data_folder, f'tmy_{city_name}.csv')
+        file_stem = os.path.join(data_folder, f'tmy_{city_name}')
     else:
-        file_path = os.path.join(data_folder, f'tmy_{latitude:.4f}_{longitude:.4f}.csv')
+        file_stem = os.path.join(data_folder, f'tmy_{latitude:.4f}_{longitude:.4f}')
+    file_path = f'{file_stem}.parquet'
+    legacy_csv_path = f'{file_stem}.csv'
     if os.path.exists(file_path):
-        return pd.read_csv(file_path, index_col=0, parse_dates=True)
+        return _add_daily_profile_slice(pd.read_parquet(file_path))
+    if os.path.exists(legacy_csv_path):
+        try:
+            tmy_data = pd.read_csv(legacy_csv_path, index_col=0, parse_dates=True)
+        except FileNotFoundError:
+            # Another loader finished the migration in the meantime
+            return _add_daily_profile_slice(pd.read_parquet(file_path))
+        _write_parquet_atomic(tmy_data, file_path)
+        try:
+            os.remove(legacy_csv_path)
+        except FileNotFoundError:
+            pass
+        return _add_daily_profile_slice(tmy_data)
     try:
         tmy_data, _ = pvlib.iotools.get_pvgis_tmy(latitude=latitude, longitude=longitude, map_variables=True)
-        tmy_data.to_csv(file_path)
-        return tmy_data
+        _write_parquet_atomic(tmy_data, file_path)
+        return _add_daily_profile_slice(tmy_data)
     except Exception as e:
         print(f"Error downloading data: {e}")
         return None
 
-def run_simulation(tmy_data, tilt, azimuth, lat, lon, module_name, inverter_name):
+@functools.lru_cache(maxsize=32)
+def _build_system(lat, lon, tilt, azimuth, module_name, inverter_name):
     """
-    Runs the full PV simulation using pvlib's ModelChain.
-    Returns: specific_yield (kWh/kWp), ac_power (W), component names, and a dictionary of loss proportions.
+    Builds the Location and PVSystem for a configuration once and reuses them.
     """
     location = pvlib.location.Location(latitude=lat, longitude=lon, tz='Europe/Berlin')
     
-    cec_modules = pvlib.pvsystem.retrieve_sam('CECMod')
-    cec_inverters = pvlib.pvsystem.retrieve_sam('CECInverter')
-    
-    module = cec_modules[module_name]
-    inverter = cec_inverters[inverter_name]
+    module = _get_sam('CECMod')[module_name]
+    inverter = _get_sam('CECInverter')[inverter_name]
     
     system = pvlib.pvsystem.PVSystem(
         surface_tilt=tilt, 
@@ -66,21 +136,39 @@ def run_simulation(tmy_data, tilt, azimuth, lat, lon, module_name, inverter_name
         module_type='glass_polymer'
     )
     
+    return location, system
+
+def run_simulation(tmy_data, tilt, azimuth, lat, lon, module_name, inverter_name):
+    """
+    Runs the full PV simulation using pvlib's ModelChain.
+    Returns: specific_yield (kWh/kWp), ac_power (W), component names, and a dictionary of loss proportions.
+    """
+    location, system = _build_system(lat, lon, tilt, azimuth, module_name, inverter_name)
+    # ModelChain binds its model steps and results to itself, so each run gets its own
     mc = pvlib.modelchain.ModelChain(system, location, aoi_model='ashrae')
     mc.run_model(tmy_data)
     
+    module = mc.system.arrays[0].module_parameters
+    inverter = mc.system.inverter_parameters
+    
     module_power_kwp = module['STC'] / 1000
     
-    actual_ac_energy_kwh = mc.results.ac.sum() / 1000
+    ac_sum, dc_sum, irradiance_sum = _reduce3(
+        mc.results.ac.to_numpy(dtype=np.float64),
+        mc.results.dc['p_mp'].to_numpy(dtype=np.float64),
+        mc.results.effective_irradiance.to_numpy(dtype=np.float64),
+    )
+
+    actual_ac_energy_kwh = ac_sum / 1000
     specific_yield = actual_ac_energy_kwh / module_power_kwp
     
-    dc_energy_kwh = mc.results.dc['p_mp'].sum() / 1000
+    dc_energy_kwh = dc_sum / 1000
     
     inverter_loss_kwh = dc_energy_kwh - actual_ac_energy_kwh
     
     num_modules_per_kwp = 1000 / module['STC']
     system_area = num_modules_per_kwp * module['A_c']
-    poa_energy_kwh = mc.results.effective_irradiance.sum() * system_area / 1000
+    poa_energy_kwh = irradiance_sum * system_area / 1000
     
     dc_system_loss_kwh = poa_energy_kwh - dc_energy_kwh
 
@@ -93,45 +181,106 @@ def run_simulation(tmy_data, tilt, azimuth, lat, lon, module_name, inverter_name
         "final_yield_ratio": actual_ac_energy_kwh / total_energy_input
     }
     
-    return specific_yield, mc.results.ac, module.name, inverter.name, loss_proportions
+    ac_power = mc.results.ac
+    if 'jul15' in tmy_data.attrs:
+        ac_power.attrs['jul15'] = tmy_data.attrs['jul15']
+    
+    return specific_yield, ac_power, module.name, inverter.name, loss_proportions
+
+def _worker(params):
+    """
+    Runs one simulation of a batch. Takes and returns plain dicts so it can be pickled across processes.
+    """
+    try:
+        tmy_data = get_tmy_data(params['lat'], params['lon'], city_name=params.get('city_name'))
+        if tmy_data is None:
+            return {**params, 'error': 'TMY data unavailable'}
+        specific_yield, _, module_name, inverter_name, loss_proportions = run_simulation(
+            tmy_data, params['tilt'], params['azimuth'], params['lat'], params['lon'],
+            params['module_name'], params['inverter_name'])
+        return {**params, 'specific_yield': specific_yield, 'final_yield_ratio': loss_proportions['final_yield_ratio']}
+    except Exception as e:
+        return {**params, 'error': str(e)}
 
-def create_plots(ac_power, plots_folder='results'):
+def run_batch(param_list):
     """
-    Generates monthly and daily production plots.
+    Runs a list of independent simulations in parallel across CPU cores.
+    Each entry is a dict with lat, lon, tilt, azimuth, module_name, inverter_name and optionally city_name.
     """
+    # Spawned workers don't inherit the GUI's Tk state and threads
+    with ProcessPoolExecutor(max_workers=os.cpu_count(), mp_context=multiprocessing.get_context('spawn')) as executor:
+        return list(executor.map(_worker, param_list, chunksize=2))
+
+MONTH_LABELS = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+
+def monthly_sums(s):
+    """
+    Returns the 12 monthly totals of an hourly power series (W) in kWh, indexed by month label.
+    """
+    totals = np.bincount(s.index.month - 1, weights=np.nan_to_num(s.to_numpy(dtype=np.float64)), minlength=12) / 1000.0
+    return pd.Series(totals, index=MONTH_LABELS)
+
+def _new_figure():
+    """
+    Creates a standalone figure (not tracked by pyplot) so it can be reused and rendered from worker threads.
+    """
+    return Figure(figsize=(5, 4))
+
+def _save_figure(fig, file_name, plots_folder=None):
+    """
+    Renders a figure to PNG. Returns an in-memory buffer, or the file path when a plots folder is given.
+    """
+    if plots_folder is None:
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format='png')
+        buffer.seek(0)
+        return buffer
     os.makedirs(plots_folder, exist_ok=True)
-    
-    monthly_yield = ac_power.resample('ME').sum() / 1000
-    plt.figure(figsize=(5.5, 4.5))
-    monthly_yield.index = monthly_yield.index.strftime('%b')
-    monthly_yield.plot(kind='bar', color='orange')
-    plt.title('Monthly Production (kWh/kWp)')
-    plt.ylabel('Production (kWh/kWp)')
-    plt.xticks(rotation=45)
-    plt.tight_layout()
-    monthly_plot_path = os.path.join(plots_folder, 'monthly_yield.png')
-    plt.savefig(monthly_plot_path)
-    plt.close()
-
-    daily_power = ac_power[(ac_power.index.month == 7) & (ac_power.index.day == 15)]
-    plt.figure(figsize=(5.5, 4.5))
-    daily_power.plot(kind='line', color='gold')
-    plt.title('Daily Profile (Sunny Day)')
-    plt.ylabel('Power Output (W)')
-    plt.grid(True)
-    plt.tight_layout()
-    daily_plot_path = os.path.join(plots_folder, 'daily_profile.png')
-    plt.savefig(daily_plot_path)
-    plt.close()
-    
-    return monthly_plot_path, daily_plot_path
+    file_path = os.path.join(plots_folder, file_name)
+    fig.savefig(file_path)
+    return file_path
 
-def create_loss_diagram(losses, plots_folder='results'):
+def create_monthly_plot(ac_power, fig=None, plots_folder=None):
+    """
+    Generates the monthly production plot.
+    Returns the plot and the monthly totals (kWh) it was drawn from.
+    """
+    monthly_yield = monthly_sums(ac_power)
+    fig = fig or _new_figure()
+    fig.clear()
+    ax = fig.add_subplot(111)
+    monthly_yield.plot(kind='bar', color='orange', ax=ax)
+    ax.set_title('Monthly Production (kWh/kWp)')
+    ax.set_ylabel('Production (kWh/kWp)')
+    ax.tick_params(axis='x', labelrotation=45)
+    fig.subplots_adjust(left=0.15, right=0.95, top=0.9, bottom=0.16)
+    monthly_plot = _save_figure(fig, 'monthly_yield.png', plots_folder)
+    return monthly_plot, monthly_yield
+
+def create_daily_plot(ac_power, daily_slice=None, fig=None, plots_folder=None):
+    """
+    Generates the daily production profile for a sunny day.
+    daily_slice is the precomputed positional slice of the sunny day, if known.
+    """
+    if daily_slice is not None:
+        daily_power = ac_power.iloc[daily_slice]
+    else:
+        daily_power = ac_power[(ac_power.index.month == 7) & (ac_power.index.day == 15)]
+    fig = fig or _new_figure()
+    fig.clear()
+    ax = fig.add_subplot(111)
+    daily_power.plot(kind='line', color='gold', ax=ax)
+    ax.set_title('Daily Profile (Sunny Day)')
+    ax.set_ylabel('Power Output (W)')
+    ax.grid(True)
+    fig.subplots_adjust(left=0.15, right=0.95, top=0.9, bottom=0.18)
+    daily_plot = _save_figure(fig, 'daily_profile.png', plots_folder)
+    return daily_plot
+
+def create_loss_diagram(losses, fig=None, plots_folder=None):
     """
     Generates a waterfall-style loss diagram for professional analysis.
     """
-    os.makedirs(plots_folder, exist_ok=True)
-    
     start = losses["POA Energy (kWh)"]
     dc_loss = losses["DC System Loss (kWh)"]
     inverter_loss = losses["Inverter Loss (kWh)"]
@@ -140,90 +289,98 @@ def create_loss_diagram(losses, plots_folder='results'):
     labels = ['POA Energy', 'DC System Loss', 'Inverter Loss', 'Final AC Yield']
     values = [start, -dc_loss, -inverter_loss, final_yield]
     
-    plt.figure(figsize=(5.5, 4.5))
+    fig = fig or _new_figure()
+    fig.clear()
+    ax = fig.add_subplot(111)
     
     colors = ['#1f77b4', '#d62728', '#ff7f0e', '#2ca02c']
     
-    plt.bar(labels, values, color=colors)
+    ax.bar(labels, values, color=colors)
     
-    plt.text(0, start + 50, f'{start:.0f}', ha='center', va='bottom', fontweight='bold')
-    plt.text(1, start - dc_loss - 50, f'-{dc_loss:.0f}', ha='center', va='top', fontweight='bold', color='black')
-    plt.text(2, start - dc_loss - inverter_loss - 50, f'-{inverter_loss:.0f}', ha='center', va='top', fontweight='bold', color='black')
-    plt.text(3, final_yield + 50, f'{final_yield:.0f}', ha='center', va='bottom', fontweight='bold')
-
-    plt.plot([0, 1], [start, start - dc_loss], color='gray', linestyle='--')
-    plt.plot([1, 2], [start - dc_loss, start - dc_loss - inverter_loss], color='gray', linestyle='--')
-    plt.plot([2, 3], [start - dc_loss - inverter_loss, final_yield], color='gray', linestyle='--')
-
-    plt.title('Energy Loss Diagram (kWh per kWp)')
-    plt.ylabel('Energy (kWh/kWp)')
-    plt.xticks(rotation=45, ha="right")
-    plt.grid(axis='y', linestyle='--')
-    plt.tight_layout()
-    loss_plot_path = os.path.join(plots_folder, 'loss_diagram.png')
-    plt.savefig(loss_plot_path)
-    plt.close()
-    return loss_plot_path
-
-def create_economic_plot(cost, specific_yield, price, annual_degradation_rate, plots_folder='results'):
+    ax.text(0, start + 50, f'{start:.0f}', ha='center', va='bottom', fontweight='bold')
+    ax.text(1, start - dc_loss - 50, f'-{dc_loss:.0f}', ha='center', va='top', fontweight='bold', color='black')
+    ax.text(2, start - dc_loss - inverter_loss - 50, f'-{inverter_loss:.0f}', ha='center', va='top', fontweight='bold', color='black')
+    ax.text(3, final_yield + 50, f'{final_yield:.0f}', ha='center', va='bottom', fontweight='bold')
+
+    ax.plot([0, 1], [start, start - dc_loss], color='gray', linestyle='--')
+    ax.plot([1, 2], [start - dc_loss, start - dc_loss - inverter_loss], color='gray', linestyle='--')
+    ax.plot([2, 3], [start - dc_loss - inverter_loss, final_yield], color='gray', linestyle='--')
+
+    ax.set_title('Energy Loss Diagram (kWh per kWp)')
+    ax.set_ylabel('Energy (kWh/kWp)')
+    plt.setp(ax.get_xticklabels(), rotation=45, ha="right")
+    ax.grid(axis='y', linestyle='--')
+    fig.subplots_adjust(left=0.17, right=0.95, top=0.9, bottom=0.3)
+    loss_plot = _save_figure(fig, 'loss_diagram.png', plots_folder)
+    return loss_plot
+
+def payback_years(cost, specific_yield, price, annual_degradation_rate):
+    """
+    Solves cost = y*p*(1 - (1-r)**n) / r for n, the payback period in years.
+    Returns np.inf if the system never pays for itself.
+    """
+    first_year_savings = specific_yield * price
+    if cost <= 0:
+        return 0.0
+    if first_year_savings <= 0:
+        return np.inf
+    if annual_degradation_rate == 0:
+        return cost / first_year_savings
+    remaining_fraction = 1 - cost * annual_degradation_rate / first_year_savings
+    if remaining_fraction <= 0:
+        return np.inf
+    return math.log(remaining_fraction) / math.log(1 - annual_degradation_rate)
+
+def create_economic_plot(cost, specific_yield, price, annual_degradation_rate, fig=None, plots_folder=None):
     """
     Generates a payback period analysis plot, considering degradation.
     """
-    os.makedirs(plots_folder, exist_ok=True)
-    
     years = np.arange(0, 26)
     
-    cumulative_savings = np.zeros_like(years, dtype=float)
-    current_yield = specific_yield
-    
-    for i in range(1, len(years)):
-        annual_savings = current_yield * price
-        cumulative_savings[i] = cumulative_savings[i-1] + annual_savings
-        current_yield *= (1 - annual_degradation_rate)
+    annual_savings = specific_yield * price * (1 - annual_degradation_rate) ** np.arange(0, len(years) - 1)
+    cumulative_savings = np.concatenate([[0.0], np.cumsum(annual_savings)])
         
     remaining_cost = cost - cumulative_savings
     
-    plt.figure(figsize=(5.5, 4.5))
-    plt.plot(years, remaining_cost, label='Remaining Cost', color='red')
-    plt.axhline(0, color='green', linestyle='--', label='Break-even Point')
+    fig = fig or _new_figure()
+    fig.clear()
+    ax = fig.add_subplot(111)
+    ax.plot(years, remaining_cost, label='Remaining Cost', color='red')
+    ax.axhline(0, color='green', linestyle='--', label='Break-even Point')
     
-    payback_period = np.interp(0, -remaining_cost, years)
+    payback_period = payback_years(cost, specific_yield, price, annual_degradation_rate)
     
     if 0 < payback_period < 25:
-        plt.plot(payback_period, 0, 'go', markersize=10, label='Payback Point')
-        plt.text(payback_period, -100, f'~{payback_period:.1f} years', ha='center', color='green', fontweight='bold')
+        ax.plot(payback_period, 0, 'go', markersize=10, label='Payback Point')
+        ax.text(payback_period, -100, f'~{payback_period:.1f} years', ha='center', color='green', fontweight='bold')
     
-    plt.title('Payback Period Analysis (€/kWp)')
-    plt.xlabel('Years')
-    plt.ylabel('Net Cost or Savings (€/kWp)')
-    plt.grid(True)
-    plt.legend()
-    plt.tight_layout()
-    economic_plot_path = os.path.join(plots_folder, 'economic_plot.png')
-    plt.savefig(economic_plot_path)
-    plt.close()
-    return economic_plot_path, payback_period
-
-def create_environmental_plot(co2_saved_kg, plots_folder='results'):
+    ax.set_title('Payback Period Analysis (€/kWp)')
+    ax.set_xlabel('Years')
+    ax.set_ylabel('Net Cost or Savings (€/kWp)')
+    ax.grid(True)
+    ax.legend()
+    fig.subplots_adjust(left=0.17, right=0.95, top=0.9, bottom=0.13)
+    economic_plot = _save_figure(fig, 'economic_plot.png', plots_folder)
+    return economic_plot, payback_period
+
+def create_environmental_plot(co2_saved_kg, fig=None, plots_folder=None):
     """
     Generates a cumulative CO₂ saved plot.
     """
-    os.makedirs(plots_folder, exist_ok=True)
-    
     years = np.arange(0, 26)
     cumulative_co2_saved = years * co2_saved_kg
     
-    plt.figure(figsize=(5.5, 4.5))
-    plt.bar(years, cumulative_co2_saved, color='green', alpha=0.7)
-    plt.title('Cumulative CO₂ Saved (kg)')
-    plt.xlabel('Years')
-    plt.ylabel('Cumulative CO₂ Saved (kg)')
-    plt.grid(True)
-    plt.tight_layout()
-    environmental_plot_path = os.path.join(plots_folder, 'environmental_plot.png')
-    plt.savefig(environmental_plot_path)
-    plt.close()
-    return environmental_plot_path
+    fig = fig or _new_figure()
+    fig.clear()
+    ax = fig.add_subplot(111)
+    ax.bar(years, cumulative_co2_saved, color='green', alpha=0.7)
+    ax.set_title('Cumulative CO₂ Saved (kg)')
+    ax.set_xlabel('Years')
+    ax.set_ylabel('Cumulative CO₂ Saved (kg)')
+    ax.grid(True)
+    fig.subplots_adjust(left=0.17, right=0.95, top=0.9, bottom=0.13)
+    environmental_plot = _save_figure(fig, 'environmental_plot.png', plots_folder)
+    return environmental_plot
 
 
 # --- PART 2: GRAPHICAL USER INTERFACE (FRONTEND) ---
@@ -238,9 +395,24 @@ class SolarSimulatorApp(customtkinter.CTk):
         self.grid_rowconfigure(0, weight=1)
         
         self.simulation_results = None
-
-        self.module_names = sorted(list(pvlib.pvsystem.retrieve_sam('CECMod').columns))
-        self.inverter_names = sorted(list(pvlib.pvsystem.retrieve_sam('CECInverter').columns))
+        self._slider_after_id = None
+        # Raw pvlib results keyed by location, orientation and components; health,
+        # degradation and economic inputs are applied afterwards in update_gui_results.
+        self._sim_cache = OrderedDict()
+        self._sim_cache_size = 16
+
+        # Plot figures are allocated once and redrawn in place on every run.
+        self._figs = {k: _new_figure() for k in ('monthly', 'daily', 'loss', 'econ', 'env')}
+        self._plot_pool = ThreadPoolExecutor(max_workers=5)
+        # Plots are handed to the GUI in memory; set a folder here to also keep PNG copies on disk.
+        self.plots_folder = None
+        self._photos = {k: None for k in self._figs}
+        # TMY data is fetched in the background as soon as a city is picked
+        self._io_pool = ThreadPoolExecutor(max_workers=2)
+        self._tmy_futures = {}
+
+        self.module_names = sorted(list(_get_sam('CECMod').columns))
+        self.inverter_names = sorted(list(_get_sam('CECInverter').columns))
 
         self.tab_view = customtkinter.CTkTabview(self)
         self.tab_view.grid(row=0, column=0, padx=20, pady=20, sticky="nsew")
@@ -359,6 +531,18 @@ class SolarSimulatorApp(customtkinter.CTk):
         self.environmental_plot_label = customtkinter.CTkLabel(results_frame_3, text="")
         self.environmental_plot_label.pack(pady=10, padx=10)
 
+        # --- TAB 4: CITY COMPARISON ---
+        self.tab_view.add("City Comparison")
+        tab_4 = self.tab_view.tab("City Comparison")
+        tab_4.grid_columnconfigure(0, weight=1)
+        tab_4.grid_rowconfigure(1, weight=1)
+
+        customtkinter.CTkLabel(tab_4, text="Annual Yield by City (current orientation and components)", font=("Arial", 16, "bold")).grid(row=0, column=0, padx=20, pady=10)
+        self.scan_textbox = customtkinter.CTkTextbox(tab_4, font=("Courier New", 14))
+        self.scan_textbox.grid(row=1, column=0, padx=20, pady=(0, 20), sticky="nsew")
+        self.scan_textbox.insert("end", "Press 'Scan All Cities' to compare every pre-configured city.")
+        self.scan_textbox.configure(state="disabled")
+
         # --- GLOBAL ELEMENTS (OUTSIDE OF TABS) ---
         bottom_frame = customtkinter.CTkFrame(self, fg_color="transparent")
         bottom_frame.grid(row=1, column=0, padx=20, pady=(0, 20), sticky="ew")
@@ -370,6 +554,9 @@ class SolarSimulatorApp(customtkinter.CTk):
         self.run_button = customtkinter.CTkButton(action_buttons_frame, text="Run Simulation", command=self.start_simulation_thread, font=("Arial", 14, "bold"))
         self.run_button.pack(side="left", pady=5, padx=10)
 
+        self.scan_button = customtkinter.CTkButton(action_buttons_frame, text="Scan All Cities", command=self.start_batch_thread, font=("Arial", 14, "bold"))
+        self.scan_button.pack(side="left", pady=5, padx=10)
+
         self.export_button = customtkinter.CTkButton(action_buttons_frame, text="Export Results (CSV)", command=self.export_to_csv, font=("Arial", 14, "bold"), state="disabled")
         self.export_button.pack(side="left", pady=5, padx=10)
         
@@ -411,6 +598,8 @@ class SolarSimulatorApp(customtkinter.CTk):
             
     def city_selected(self, city_name):
         lat, lon = GERMAN_CITIES[city_name]
+        if city_name not in self._tmy_futures:
+            self._tmy_futures[city_name] = self._io_pool.submit(get_tmy_data, lat, lon, city_name)
         self.lat_entry.configure(state="normal")
         self.lon_entry.configure(state="normal")
         self.lat_entry.delete(0, "end")
@@ -422,6 +611,13 @@ class SolarSimulatorApp(customtkinter.CTk):
             self.lon_entry.configure(state="disabled")
             
     def update_slider_labels(self, _=None):
+        # Sliders fire on every pixel of a drag; coalesce the label redraws
+        if self._slider_after_id:
+            self.after_cancel(self._slider_after_id)
+        self._slider_after_id = self.after(50, self._apply_slider_labels)
+
+    def _apply_slider_labels(self):
+        self._slider_after_id = None
         self.tilt_label.configure(text=f"Tilt: {int(self.tilt_slider.get())}°")
         self.azimuth_label.configure(text=f"Azimuth: {int(self.azimuth_slider.get())}° (South)")
         self.health_label.configure(text=f"System Health: {int(self.health_slider.get())}%")
@@ -444,19 +640,48 @@ class SolarSimulatorApp(customtkinter.CTk):
             selected_module = self.module_combobox.get()
             selected_inverter = self.inverter_combobox.get()
 
-            tmy_data = get_tmy_data(lat, lon, city_name=city_name)
-            if tmy_data is not None:
-                specific_yield, ac_power, module_name, inverter_name, loss_proportions = run_simulation(tmy_data, tilt, azimuth, lat, lon, selected_module, selected_inverter)
-                self.after(0, self.update_gui_results, specific_yield, ac_power, cost, price, co2_intensity, module_name, inverter_name, loss_proportions, annual_degradation_rate)
+            cache_key = (city_name or (lat, lon), tilt, azimuth, selected_module, selected_inverter)
+            sim_result = self._sim_cache.get(cache_key)
+            if sim_result is not None:
+                self._sim_cache.move_to_end(cache_key)
+            else:
+                tmy_data = self._get_tmy_data(lat, lon, city_name)
+                if tmy_data is None:
+                    self.after(0, self.simulation_finished, "Error")
+                    return
+                sim_result = run_simulation(tmy_data, tilt, azimuth, lat, lon, selected_module, selected_inverter)
+                self._sim_cache[cache_key] = sim_result
+                if len(self._sim_cache) > self._sim_cache_size:
+                    self._sim_cache.popitem(last=False)
+
+            specific_yield, ac_power, module_name, inverter_name, loss_proportions = sim_result
+            self.after(0, self.update_gui_results, specific_yield, ac_power, cost, price, co2_intensity, module_name, inverter_name, loss_proportions, annual_degradation_rate)
         except Exception as e:
             print(f"An error occurred during simulation: {e}")
             self.after(0, self.simulation_finished, "Error")
             
+    def _get_tmy_data(self, lat, lon, city_name):
+        # Manual coordinates have nothing to prefetch and load synchronously
+        if city_name is None:
+            return get_tmy_data(lat, lon)
+        future = self._tmy_futures.get(city_name)
+        if future is None:
+            future = self._tmy_futures[city_name] = self._io_pool.submit(get_tmy_data, lat, lon, city_name)
+        try:
+            tmy_data = future.result()
+        except Exception:
+            # Forget failed loads so the next run retries
+            self._tmy_futures.pop(city_name, None)
+            raise
+        if tmy_data is None:
+            self._tmy_futures.pop(city_name, None)
+        return tmy_data
+
     def update_gui_results(self, specific_yield, ac_power, cost, price, co2_intensity, module_name, inverter_name, loss_proportions, annual_degradation_rate):
         system_health_factor = self.health_slider.get() / 100.0
         real_specific_yield = specific_yield * system_health_factor
-        
-        monthly_plot_path, daily_plot_path = create_plots(ac_power * system_health_factor)
+        # Scaled once; the plots and the exported monthly totals all derive from it
+        ac_scaled = ac_power * system_health_factor
         
         # Calculate consistent losses based on the final real yield
         total_energy_input_scaled = real_specific_yield / loss_proportions['final_yield_ratio']
@@ -470,18 +695,30 @@ class SolarSimulatorApp(customtkinter.CTk):
             "Final AC Yield (kWh)": real_specific_yield,
         }
 
-        loss_plot_path = create_loss_diagram(scaled_losses)
-        
         annual_savings = real_specific_yield * price
-        
-        economic_plot_path, payback_period = create_economic_plot(cost, real_specific_yield, price, annual_degradation_rate)
-        
         co2_saved_kg = (real_specific_yield * co2_intensity) / 1000
-        environmental_plot_path = create_environmental_plot(co2_saved_kg)
+
+        # Each plot draws on its own figure, so they can render concurrently
+        figs = self._figs
+        futures = {
+            'monthly': self._plot_pool.submit(create_monthly_plot, ac_scaled, figs['monthly'], self.plots_folder),
+            'daily': self._plot_pool.submit(create_daily_plot, ac_scaled, ac_power.attrs.get('jul15'), figs['daily'], self.plots_folder),
+            'loss': self._plot_pool.submit(create_loss_diagram, scaled_losses, figs['loss'], self.plots_folder),
+            'econ': self._plot_pool.submit(create_economic_plot, cost, real_specific_yield, price, annual_degradation_rate, figs['econ'], self.plots_folder),
+            'env': self._plot_pool.submit(create_environmental_plot, co2_saved_kg, figs['env'], self.plots_folder),
+        }
+        wait(futures.values())
+
+        monthly_plot, monthly_yield = futures['monthly'].result()
+        daily_plot = futures['daily'].result()
+        loss_plot = futures['loss'].result()
+        economic_plot, payback_period = futures['econ'].result()
+        environmental_plot = futures['env'].result()
         
         self.yield_label.configure(text=f"Annual Yield\n{real_specific_yield:.0f} kWh/kWp")
         self.savings_label.configure(text=f"Annual Savings\n{annual_savings:.0f} €/kWp")
-        self.payback_label.configure(text=f"Payback Period\n{payback_period:.1f} Years")
+        payback_text = f"{payback_period:.1f} Years" if np.isfinite(payback_period) else "Never"
+        self.payback_label.configure(text=f"Payback Period\n{payback_text}")
         self.co2_label.configure(text=f"CO₂ Saved Annually\n{co2_saved_kg:.0f} kg per kWp installed")
 
         self.simulation_results = {
@@ -497,33 +734,74 @@ class SolarSimulatorApp(customtkinter.CTk):
                 "Annual CO2 Saved (kg/kWp)": co2_saved_kg,
             },
             "Losses (kWh)": scaled_losses,
-            "Monthly Production (kWh/kWp)": (ac_power.resample('ME').sum() / 1000) * system_health_factor,
+            "Monthly Production (kWh/kWp)": monthly_yield,
             "Components": {"Module": module_name, "Inverter": inverter_name}
         }
 
-        img_size = (400, 320)
-        monthly_img = customtkinter.CTkImage(light_image=Image.open(monthly_plot_path), size=img_size)
-        self.monthly_plot_label.configure(image=monthly_img)
-        
-        daily_img = customtkinter.CTkImage(light_image=Image.open(daily_plot_path), size=img_size)
-        self.daily_plot_label.configure(image=daily_img)
-
-        loss_img = customtkinter.CTkImage(light_image=Image.open(loss_plot_path), size=img_size)
-        self.loss_plot_label.configure(image=loss_img)
-        
-        economic_img = customtkinter.CTkImage(light_image=Image.open(economic_plot_path), size=img_size)
-        self.economic_plot_label.configure(image=economic_img)
-
-        environmental_img = customtkinter.CTkImage(light_image=Image.open(environmental_plot_path), size=img_size)
-        self.environmental_plot_label.configure(image=environmental_img)
+        self._show_plot('monthly', monthly_plot, self.monthly_plot_label)
+        self._show_plot('daily', daily_plot, self.daily_plot_label)
+        self._show_plot('loss', loss_plot, self.loss_plot_label)
+        self._show_plot('econ', economic_plot, self.economic_plot_label)
+        self._show_plot('env', environmental_plot, self.environmental_plot_label)
 
         self.system_details_label.configure(text=f"Simulated Components: {module_name}  |  {inverter_name}")
         self.simulation_finished("Run Simulation")
         self.export_button.configure(state="normal")
         
+    def _show_plot(self, key, plot, label):
+        # Plots are rendered at display size, so the label's PhotoImage is refilled in place
+        img = Image.open(plot)
+        photo = self._photos[key]
+        if photo is None or (photo.width(), photo.height()) != img.size:
+            self._photos[key] = ImageTk.PhotoImage(img)
+            label.configure(image=self._photos[key])
+        else:
+            photo.paste(img)
+
     def simulation_finished(self, button_text):
         self.run_button.configure(state="normal", text=button_text)
 
+    def start_batch_thread(self):
+        thread = threading.Thread(target=self.run_batch_task)
+        thread.daemon = True
+        thread.start()
+        self.scan_button.configure(state="disabled", text="Scanning...")
+
+    def run_batch_task(self):
+        try:
+            tilt, azimuth = int(self.tilt_slider.get()), int(self.azimuth_slider.get())
+            price = float(self.price_entry.get())
+            param_list = [
+                {"city_name": city, "lat": lat, "lon": lon, "tilt": tilt, "azimuth": azimuth,
+                 "module_name": self.module_combobox.get(), "inverter_name": self.inverter_combobox.get()}
+                for city, (lat, lon) in GERMAN_CITIES.items()
+            ]
+            results = run_batch(param_list)
+            self.after(0, self.update_batch_results, results, price)
+        except Exception as e:
+            print(f"An error occurred during the city scan: {e}")
+            self.after(0, self.batch_finished, "Error")
+
+    def update_batch_results(self, results, price):
+        system_health_factor = self.health_slider.get() / 100.0
+        rows = [f"{'City':<14}{'Yield (kWh/kWp)':>18}{'Savings (€/kWp)':>18}"]
+        ok_results = sorted((r for r in results if 'error' not in r), key=lambda r: r['specific_yield'], reverse=True)
+        for r in ok_results:
+            real_specific_yield = r['specific_yield'] * system_health_factor
+            rows.append(f"{r['city_name']:<14}{real_specific_yield:>18.0f}{real_specific_yield * price:>18.0f}")
+        for r in results:
+            if 'error' in r:
+                rows.append(f"{r['city_name']:<14}  Error: {r['error']}")
+
+        self.scan_textbox.configure(state="normal")
+        self.scan_textbox.delete("1.0", "end")
+        self.scan_textbox.insert("end", "\n".join(rows))
+        self.scan_textbox.configure(state="disabled")
+        self.batch_finished("Scan All Cities")
+
+    def batch_finished(self, button_text):
+        self.scan_button.configure(state="normal", text=button_text)
+
     def export_to_csv(self):
         if not self.simulation_results:
             return
@@ -533,19 +811,17 @@ class SolarSimulatorApp(customtkinter.CTk):
             return
         try:
             with open(file_path, 'w', newline='') as f:
-                f.write("SIMULATION SUMMARY\n")
-                summary_df = pd.DataFrame.from_dict(self.simulation_results["Summary"], orient='index', columns=['Value'])
-                summary_df.to_csv(f, header=False)
-                f.write("\n")
-
-                f.write("ENERGY LOSSES (kWh)\n")
-                losses_df = pd.DataFrame.from_dict(self.simulation_results["Losses (kWh)"], orient='index', columns=['Value'])
-                losses_df.to_csv(f, header=False)
-                f.write("\n")
+                writer = csv.writer(f, lineterminator='\n')
+                writer.writerow(["SIMULATION SUMMARY"])
+                writer.writerows(self.simulation_results["Summary"].items())
+                writer.writerow([])
+
+                writer.writerow(["ENERGY LOSSES (kWh)"])
+                writer.writerows(self.simulation_results["Losses (kWh)"].items())
+                writer.writerow([])
                 
                 f.write("MONTHLY PRODUCTION (kWh per kWp)\n")
                 monthly_df = self.simulation_results["Monthly Production (kWh/kWp)"].to_frame(name='Production')
-                monthly_df.index = monthly_df.index.strftime('%Y-%B')
                 monthly_df.to_csv(f)
                 
             self.system_details_label.configure(text=f"Results successfully exported to {os.path.basename(file_path)}")
@@ -0,0 +1,55 @@
+# test_interactive_simulator.py
+
+import numpy as np
+import pandas as pd
+import pvlib
+import pytest
+
+import interactive_simulator as sim
+
+LAT, LON = sim.GERMAN_CITIES["Heidelberg"]
+MODULE = "Hanwha_Q_CELLS_Q_PEAK_DUO_G5_325"
+INVERTER = "SMA_America__SB3000TL_US_22__240V_"
+
+
+@pytest.fixture(scope="module")
+def clear_sky_weather():
+    """
+    An hourly clear-sky year shaped like PVGIS TMY data, without temperature or pressure columns.
+    """
+    location = pvlib.location.Location(latitude=LAT, longitude=LON, tz='Europe/Berlin')
+    times = pd.date_range('2019-01-01', periods=8760, freq='h', tz='UTC')
+    weather = location.get_clearsky(times)
+    weather['wind_speed'] = 2.0
+    return weather
+
+
+def test_run_simulation_is_repeatable(clear_sky_weather):
+    args = (35, 180, LAT, LON, MODULE, INVERTER)
+    first_yield, first_ac, *_ = sim.run_simulation(clear_sky_weather, *args)
+    second_yield, second_ac, *_ = sim.run_simulation(clear_sky_weather, *args)
+
+    assert first_yield > 0
+    assert second_yield == pytest.approx(first_yield)
+    assert first_ac is not second_ac
+    np.testing.assert_allclose(second_ac.to_numpy(), first_ac.to_numpy())
+
+
+def test_run_simulation_with_temperature_and_pressure(clear_sky_weather):
+    # PVGIS TMY data with map_variables=True always carries both columns
+    weather = clear_sky_weather.assign(temp_air=15.0, pressure=101325.0)
+    specific_yield, ac_power, *_ = sim.run_simulation(weather, 35, 180, LAT, LON, MODULE, INVERTER)
+
+    assert specific_yield > 0
+    assert len(ac_power) == len(weather)
+
+
+def test_get_tmy_data_migrates_csv_cache(tmp_path, clear_sky_weather):
+    clear_sky_weather.to_csv(tmp_path / 'tmy_Heidelberg.csv')
+
+    migrated = sim.get_tmy_data(LAT, LON, city_name='Heidelberg', data_folder=str(tmp_path))
+    reloaded = sim.get_tmy_data(LAT, LON, city_name='Heidelberg', data_folder=str(tmp_path))
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ['tmy_Heidelberg.parquet']
+    pd.testing.assert_frame_equal(reloaded, migrated, check_freq=False)
+    assert reloaded.attrs['jul15'] == migrated.attrs['jul15']